@@ -3,15 +3,27 @@ Pytest configuration and fixtures for keystore tests.
 """
 
 import os
-import sys
 import json
+import shutil
 import tempfile
 import pytest
 from pathlib import Path
 import uuid
 
-# Add src to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+def _ramdisk_root():
+    """Return a writable RAM-backed directory for test files, or None."""
+    root = os.environ.get("PYTEST_RAMDISK", "/dev/shm")
+    if root and os.path.isdir(root) and os.access(root, os.W_OK):
+        return root
+    return None
+
+
+# Keep file operation tests off disk-backed storage where possible
+RAMDISK_ROOT = _ramdisk_root()
+
+# Private ramdisk directory holding the basetemp this conftest set, if any
+ramdisk_parent_key = pytest.StashKey[str]()
 
 
 @pytest.fixture
@@ -133,7 +145,7 @@ def invalid_keystore_wrong_version():
 @pytest.fixture
 def temp_directory():
     """Create a temporary directory for testing."""
-    with tempfile.TemporaryDirectory() as tmpdir:
+    with tempfile.TemporaryDirectory(dir=RAMDISK_ROOT) as tmpdir:
         yield tmpdir
 
 
@@ -165,6 +177,7 @@ def kdf_test_params():
 
 
 # Mark slow tests
+@pytest.hookimpl(tryfirst=True)
 def pytest_configure(config):
     """Configure custom pytest markers."""
     config.addinivalue_line(
@@ -173,6 +186,22 @@ def pytest_configure(config):
     config.addinivalue_line(
         "markers", "integration: marks tests as integration tests"
     )
+    
+    # Place tmp_path directories on the ramdisk unless --basetemp was given.
+    # Runs before the tmpdir plugin reads basetemp (tryfirst).
+    # The ramdisk root is world-writable, so nest basetemp in a mkdtemp
+    # directory (mode 0700, unpredictable name) that other users cannot pre-create.
+    if RAMDISK_ROOT and config.option.basetemp is None:
+        parent = tempfile.mkdtemp(prefix="pytest-", dir=RAMDISK_ROOT)
+        config.option.basetemp = os.path.join(parent, "basetemp")
+        config.stash[ramdisk_parent_key] = parent
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """Remove the ramdisk basetemp after a passing run; keep it for inspection on failure."""
+    parent = session.config.stash.get(ramdisk_parent_key, None)
+    if parent and not session.testsfailed:
+        shutil.rmtree(parent, ignore_errors=True)
 
 
 # Skip slow tests by default in CI
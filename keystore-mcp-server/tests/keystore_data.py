@@ -0,0 +1,44 @@
+"""
+Shared keystore test data.
+"""
+
+import os
+import uuid
+
+
+def _env_flag(name):
+    """Parse a boolean environment variable, rejecting unrecognised values."""
+    value = os.environ.get(name, "").strip().lower()
+    if value in ("1", "true", "yes", "on"):
+        return True
+    if value in ("", "0", "false", "no", "off"):
+        return False
+    raise ValueError(f"{name} must be a boolean (1/0, true/false, yes/no, on/off), got {value!r}")
+
+
+# scrypt N for the metadata-only keystore templates; no test runs the KDF with it
+TEMPLATE_SCRYPT_N = 1024 if _env_flag("KEYSTORE_TESTS_FAST") else 262144
+
+
+# Shared keystore template for structure and file tests; copy before mutating
+KEYSTORE_TEMPLATE = {
+    "version": 3,
+    "id": str(uuid.uuid4()),
+    "address": "742d35cc6634c0532925a3b844bc9e7595f8fe00",
+    "crypto": {
+        "ciphertext": "a" * 64,
+        "cipherparams": {
+            "iv": "b" * 32
+        },
+        "cipher": "aes-128-ctr",
+        "kdf": "scrypt",
+        "kdfparams": {
+            "n": TEMPLATE_SCRYPT_N,
+            "r": 8,
+            "p": 1,
+            "dklen": 32,
+            "salt": "c" * 64
+        },
+        "mac": "d" * 64
+    }
+}
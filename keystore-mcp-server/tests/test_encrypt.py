@@ -3,14 +3,10 @@ Tests for keystore encryption functionality.
 """
 
 import json
+import os
 import pytest
 from unittest.mock import MagicMock, patch
 
-# Import crypto modules
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
-
 from keystore_mcp.crypto.kdf import derive_key_scrypt, derive_key_pbkdf2
 from keystore_mcp.crypto.cipher import encrypt_aes_ctr, decrypt_aes_ctr
 from keystore_mcp.crypto.mac import compute_mac, verify_mac
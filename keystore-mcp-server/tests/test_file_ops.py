@@ -4,14 +4,10 @@ Tests for keystore file operations.
 
 import json
 import os
-import tempfile
 import pytest
 from pathlib import Path
-import uuid
-
-import sys
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
+from .keystore_data import KEYSTORE_TEMPLATE
 from keystore_mcp.utils.file_utils import (
     generate_keystore_filename,
     secure_write_file,
@@ -19,98 +15,56 @@ from keystore_mcp.utils.file_utils import (
     validate_filepath,
 )
 
-
-class TestFilenameGeneration:
-    """Tests for keystore filename generation."""
-    
-    def test_generate_standard_filename(self):
-        """Test generating standard keystore filename."""
-        address = "742d35cc6634c0532925a3b844bc9e7595f8fe00"
-        filename = generate_keystore_filename(address)
-        
-        assert filename.startswith("UTC--")
-        assert address in filename
-    
-    def test_generate_filename_with_0x_prefix(self):
-        """Test filename generation handles 0x prefix."""
-        address = "0x742d35cc6634c0532925a3b844bc9e7595f8fe00"
-        filename = generate_keystore_filename(address)
-        
-        # Should strip 0x prefix
-        assert "0x" not in filename or filename.count("0x") == 0
-        assert "742d35cc6634c0532925a3b844bc9e7595f8fe00" in filename
-    
-    def test_generate_filename_lowercase(self):
-        """Test filename uses lowercase address."""
-        address = "742D35CC6634C0532925A3B844BC9E7595F8FE00"
-        filename = generate_keystore_filename(address)
-        
-        assert address.lower() in filename
-    
-    def test_generate_unique_filenames(self):
-        """Test that generated filenames are unique with different timestamps."""
-        import time
-        address = "742d35cc6634c0532925a3b844bc9e7595f8fe00"
-        
-        filenames = []
-        for _ in range(3):
-            filenames.append(generate_keystore_filename(address))
-            time.sleep(0.002)  # Small delay to ensure different timestamps
-        
-        # All should be unique due to timestamp
-        assert len(set(filenames)) == len(filenames)
+# Serialized once; roundtrip tests only read it
+_KEYSTORE_JSON = json.dumps(KEYSTORE_TEMPLATE, indent=2)
 
 
 class TestSecureFileOperations:
     """Tests for secure file read/write operations."""
     
-    def test_secure_write_creates_file(self):
+    def test_secure_write_creates_file(self, tmp_path):
         """Test secure_write creates file with correct content."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            filepath = os.path.join(tmpdir, "test.json")
-            content = {"test": "data"}
-            
-            secure_write_file(filepath, json.dumps(content))
-            
-            assert os.path.exists(filepath)
-            with open(filepath, 'r') as f:
-                assert json.load(f) == content
+        filepath = tmp_path / "test.json"
+        content = {"test": "data"}
+        
+        secure_write_file(filepath, json.dumps(content))
+        
+        assert os.path.exists(filepath)
+        with open(filepath, 'r') as f:
+            assert json.load(f) == content
     
-    def test_secure_write_creates_directories(self):
+    def test_secure_write_creates_directories(self, tmp_path):
         """Test secure_write creates parent directories."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            filepath = os.path.join(tmpdir, "subdir", "nested", "test.json")
-            content = {"test": "data"}
-            
-            secure_write_file(filepath, json.dumps(content))
-            
-            assert os.path.exists(filepath)
+        filepath = tmp_path / "subdir" / "nested" / "test.json"
+        content = {"test": "data"}
+        
+        secure_write_file(filepath, json.dumps(content))
+        
+        assert os.path.exists(filepath)
     
-    def test_secure_write_sets_permissions(self):
+    def test_secure_write_sets_permissions(self, tmp_path):
         """Test secure_write sets restrictive permissions (Unix only)."""
         if os.name != 'posix':
             pytest.skip("Permission test only on Unix")
         
-        with tempfile.TemporaryDirectory() as tmpdir:
-            filepath = os.path.join(tmpdir, "test.json")
-            
-            secure_write_file(filepath, "{}")
-            
-            # Check file is owner-only readable/writable
-            mode = os.stat(filepath).st_mode & 0o777
-            assert mode == 0o600
+        filepath = tmp_path / "test.json"
+        
+        secure_write_file(filepath, "{}")
+        
+        # Check file is owner-only readable/writable
+        mode = os.stat(filepath).st_mode & 0o777
+        assert mode == 0o600
     
-    def test_secure_read_returns_content(self):
+    def test_secure_read_returns_content(self, tmp_path):
         """Test secure_read returns file content."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            filepath = os.path.join(tmpdir, "test.json")
-            expected = '{"test": "data"}'
-            
-            with open(filepath, 'w') as f:
-                f.write(expected)
-            
-            result = secure_read_file(filepath)
-            assert result["content_text"] == expected
+        filepath = tmp_path / "test.json"
+        expected = '{"test": "data"}'
+        
+        with open(filepath, 'w') as f:
+            f.write(expected)
+        
+        result = secure_read_file(filepath)
+        assert result["content_text"] == expected
     
     def test_secure_read_nonexistent_file(self):
         """Test secure_read handles nonexistent file."""
@@ -121,12 +75,11 @@ class TestSecureFileOperations:
 class TestFilePathValidation:
     """Tests for file path validation."""
     
-    def test_valid_absolute_path(self):
+    def test_valid_absolute_path(self, tmp_path):
         """Test valid absolute path passes validation."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            filepath = os.path.join(tmpdir, "keystore.json")
-            is_valid, error = validate_filepath(filepath, must_exist=False)
-            assert is_valid is True
+        filepath = tmp_path / "keystore.json"
+        is_valid, error = validate_filepath(filepath, must_exist=False)
+        assert is_valid is True
     
     def test_path_traversal_attack(self):
         """Test path traversal is blocked."""
@@ -142,140 +95,104 @@ class TestFilePathValidation:
         is_valid, error = validate_filepath("/nonexistent/path.json", must_exist=True)
         assert is_valid is False
     
-    def test_directory_not_file(self):
+    def test_directory_not_file(self, tmp_path):
         """Test directory path validation for existing directory."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            is_valid, error = validate_filepath(tmpdir, must_exist=True)
-            # Directory exists, so validation passes (it's path validation, not file type check)
-            assert is_valid is True
+        is_valid, error = validate_filepath(tmp_path, must_exist=True)
+        # Directory exists, so validation passes (it's path validation, not file type check)
+        assert is_valid is True
 
 
 class TestKeystoreFileRoundtrip:
     """Integration tests for complete file operations."""
     
-    def get_test_keystore(self):
-        """Return a test keystore structure."""
-        return {
-            "version": 3,
-            "id": str(uuid.uuid4()),
-            "address": "742d35cc6634c0532925a3b844bc9e7595f8fe00",
-            "crypto": {
-                "ciphertext": "a" * 64,
-                "cipherparams": {"iv": "b" * 32},
-                "cipher": "aes-128-ctr",
-                "kdf": "scrypt",
-                "kdfparams": {
-                    "n": 262144,
-                    "r": 8,
-                    "p": 1,
-                    "dklen": 32,
-                    "salt": "c" * 64
-                },
-                "mac": "d" * 64
-            }
-        }
+    @pytest.fixture(scope="class")
+    @classmethod
+    def shared_dir(cls, tmp_path_factory):
+        """Return a directory shared by the roundtrip tests."""
+        return tmp_path_factory.mktemp("roundtrip")
     
-    def test_write_and_read_keystore(self):
+    def test_write_and_read_keystore(self, shared_dir):
         """Test writing and reading keystore file."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            keystore = self.get_test_keystore()
-            filename = generate_keystore_filename(keystore["address"])
-            filepath = os.path.join(tmpdir, filename)
-            
-            # Write
-            secure_write_file(filepath, json.dumps(keystore, indent=2))
-            
-            # Read
-            result = secure_read_file(filepath)
-            loaded = result["content_json"]
-            
-            assert loaded == keystore
+        filename = generate_keystore_filename(KEYSTORE_TEMPLATE["address"])
+        filepath = shared_dir / filename
+        
+        # Write
+        secure_write_file(filepath, _KEYSTORE_JSON)
+        
+        # Read
+        result = secure_read_file(filepath)
+        loaded = result["content_json"]
+        
+        assert loaded == KEYSTORE_TEMPLATE
     
-    def test_keystore_json_formatting(self):
+    def test_keystore_json_formatting(self, shared_dir):
         """Test keystore is written with proper JSON formatting."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            keystore = self.get_test_keystore()
-            filepath = os.path.join(tmpdir, "keystore.json")
-            
-            secure_write_file(filepath, json.dumps(keystore, indent=2))
-            
-            result = secure_read_file(filepath)
-            content = result["content_text"]
-            
-            # Should be properly formatted (indented)
-            assert "\n" in content
-            assert "  " in content  # Indentation
+        filepath = shared_dir / "keystore.json"
+        
+        secure_write_file(filepath, _KEYSTORE_JSON)
+        
+        result = secure_read_file(filepath)
+        content = result["content_text"]
+        
+        # Should be properly formatted (indented)
+        assert "\n" in content
+        assert "  " in content  # Indentation
     
-    def test_multiple_keystores_in_directory(self):
+    def test_multiple_keystores_in_directory(self, shared_dir):
         """Test managing multiple keystores in one directory."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            addresses = [
-                "742d35cc6634c0532925a3b844bc9e7595f8fe00",
-                "1234567890abcdef1234567890abcdef12345678",
-                "abcdef1234567890abcdef1234567890abcdef12",
-            ]
-            
-            files = []
-            for addr in addresses:
-                keystore = self.get_test_keystore()
-                keystore["address"] = addr
-                filename = generate_keystore_filename(addr)
-                filepath = os.path.join(tmpdir, filename)
-                secure_write_file(filepath, json.dumps(keystore))
-                files.append(filepath)
-            
-            # All files should exist
-            for f in files:
-                assert os.path.exists(f)
-            
-            # Should be 3 files (filenames contain UTC--)
-            keystore_files = [f for f in os.listdir(tmpdir) if f.startswith('UTC--')]
-            assert len(keystore_files) == 3
+        # Own subdirectory so files from other tests are not counted
+        keystore_dir = shared_dir / "multiple"
+        addresses = [
+            "742d35cc6634c0532925a3b844bc9e7595f8fe00",
+            "1234567890abcdef1234567890abcdef12345678",
+            "abcdef1234567890abcdef1234567890abcdef12",
+        ]
+        
+        files = []
+        for addr in addresses:
+            content = _KEYSTORE_JSON.replace(KEYSTORE_TEMPLATE["address"], addr)
+            filename = generate_keystore_filename(addr)
+            filepath = keystore_dir / filename
+            secure_write_file(filepath, content)
+            files.append(filepath)
+        
+        # All files should exist
+        for f in files:
+            assert os.path.exists(f)
+        
+        # Should be 3 files (filenames contain UTC--)
+        with os.scandir(keystore_dir) as entries:
+            keystore_count = sum(
+                1 for e in entries if e.name.startswith('UTC--') and e.is_file()
+            )
+        assert keystore_count == 3
 
 
 class TestEdgeCases:
     """Tests for edge cases in file operations."""
     
-    def test_unicode_in_path(self):
+    def test_unicode_in_path(self, tmp_path):
         """Test handling of Unicode characters in path."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Create subdir with unicode name
-            unicode_dir = os.path.join(tmpdir, "钱包")
-            os.makedirs(unicode_dir, exist_ok=True)
-            
-            filepath = os.path.join(unicode_dir, "keystore.json")
-            secure_write_file(filepath, "{}")
-            
-            assert os.path.exists(filepath)
+        # Create subdir with unicode name
+        unicode_dir = tmp_path / "钱包"
+        os.makedirs(unicode_dir, exist_ok=True)
+        
+        filepath = unicode_dir / "keystore.json"
+        secure_write_file(filepath, "{}")
+        
+        assert os.path.exists(filepath)
     
-    def test_very_long_path(self):
+    def test_very_long_path(self, tmp_path):
         """Test handling of very long file paths."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Create nested directories to make long path
-            long_path = tmpdir
-            for i in range(10):
-                long_path = os.path.join(long_path, f"dir{i}")
-            
-            filepath = os.path.join(long_path, "keystore.json")
-            
-            try:
-                secure_write_file(filepath, "{}")
-                assert os.path.exists(filepath)
-            except OSError:
-                # Path too long for OS - acceptable
-                pass
-    
-    def test_special_characters_in_filename(self):
-        """Test that special characters are handled safely."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Normal address without special chars
-            address = "742d35cc6634c0532925a3b844bc9e7595f8fe00"
-            filename = generate_keystore_filename(address)
-            
-            # Should not contain shell-dangerous characters
-            dangerous_chars = [';', '|', '&', '$', '`', '>', '<']
-            for char in dangerous_chars:
-                assert char not in filename
+        # Nest directories to make long path (secure_write_file creates parents)
+        filepath = os.path.join(tmp_path, *(f"dir{i}" for i in range(10)), "keystore.json")
+        
+        try:
+            secure_write_file(filepath, "{}")
+            assert os.path.exists(filepath)
+        except OSError:
+            # Path too long for OS - acceptable
+            pass
 
 
 if __name__ == "__main__":
@@ -0,0 +1,66 @@
+"""
+Tests for keystore filename generation.
+"""
+
+import re
+import pytest
+
+from keystore_mcp.utils.file_utils import generate_keystore_filename
+
+
+# Shell metacharacters that must never appear in generated filenames
+_SHELL_UNSAFE_RE = re.compile(r"[;|&$`><]")
+
+
+class TestFilenameGeneration:
+    """Tests for keystore filename generation."""
+    
+    def test_generate_standard_filename(self):
+        """Test generating standard keystore filename."""
+        address = "742d35cc6634c0532925a3b844bc9e7595f8fe00"
+        filename = generate_keystore_filename(address)
+        
+        assert filename.startswith("UTC--")
+        assert address in filename
+    
+    def test_generate_filename_with_0x_prefix(self):
+        """Test filename generation handles 0x prefix."""
+        address = "0x742d35cc6634c0532925a3b844bc9e7595f8fe00"
+        filename = generate_keystore_filename(address)
+        
+        # Should strip 0x prefix
+        assert "0x" not in filename or filename.count("0x") == 0
+        assert "742d35cc6634c0532925a3b844bc9e7595f8fe00" in filename
+    
+    def test_generate_filename_lowercase(self):
+        """Test filename uses lowercase address."""
+        address = "742D35CC6634C0532925A3B844BC9E7595F8FE00"
+        filename = generate_keystore_filename(address)
+        
+        assert address.lower() in filename
+    
+    def test_generate_unique_filenames(self):
+        """Test that generated filenames are unique with different timestamps."""
+        import time
+        address = "742d35cc6634c0532925a3b844bc9e7595f8fe00"
+        
+        # All should be unique due to timestamp
+        seen = set()
+        for _ in range(3):
+            filename = generate_keystore_filename(address)
+            assert filename not in seen
+            seen.add(filename)
+            time.sleep(0.002)  # Small delay to ensure different timestamps
+    
+    def test_special_characters_in_filename(self):
+        """Test that special characters are handled safely."""
+        # Normal address without special chars
+        address = "742d35cc6634c0532925a3b844bc9e7595f8fe00"
+        filename = generate_keystore_filename(address)
+        
+        # Should not contain shell-dangerous characters
+        assert _SHELL_UNSAFE_RE.search(filename) is None
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
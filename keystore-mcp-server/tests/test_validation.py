@@ -2,15 +2,12 @@
 Tests for keystore validation functionality.
 """
 
+import copy
 import json
-import os
 import pytest
 from unittest.mock import MagicMock, patch
-import uuid
-
-import sys
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
+from .keystore_data import KEYSTORE_TEMPLATE
 from keystore_mcp.utils.validation import (
     validate_private_key,
     validate_password,
@@ -20,51 +17,36 @@ from keystore_mcp.utils.validation import (
 )
 
 
+_VALID_KEY = "4c0883a69102937d6231471b5dbb6204fe5129617082792ae468d01a3f362318"
+
+# (private_key, expected_valid)
+_PRIVATE_KEY_VECTORS = [
+    pytest.param("0x" + _VALID_KEY, True, id="0x prefix"),
+    pytest.param(_VALID_KEY, True, id="no prefix"),
+    pytest.param("0x4c0883a69102937d6231471b5dbb6204", False, id="too short"),
+    pytest.param("0x" + "a" * 128, False, id="too long"),
+    pytest.param("0x" + "z" * 64, False, id="non-hex"),
+    pytest.param("", False, id="empty"),
+    pytest.param(None, False, id="none"),
+]
+
+
 class TestPrivateKeyValidation:
     """Tests for private key validation."""
     
-    def test_valid_private_key_hex_with_prefix(self):
-        """Test valid private key with 0x prefix."""
-        key = "0x4c0883a69102937d6231471b5dbb6204fe5129617082792ae468d01a3f362318"
-        is_valid, error, key_bytes = validate_private_key(key)
-        assert is_valid is True
-        assert key_bytes is not None
-    
-    def test_valid_private_key_hex_without_prefix(self):
-        """Test valid private key without 0x prefix."""
-        key = "4c0883a69102937d6231471b5dbb6204fe5129617082792ae468d01a3f362318"
+    @pytest.mark.parametrize("key,expected", _PRIVATE_KEY_VECTORS)
+    def test_private_key(self, key, expected):
+        """Test private key validity across valid and malformed inputs."""
         is_valid, error, key_bytes = validate_private_key(key)
-        assert is_valid is True
-        assert key_bytes is not None
+        assert is_valid is expected
+        assert (key_bytes is not None) is expected
     
-    def test_invalid_private_key_too_short(self):
-        """Test private key that's too short."""
+    def test_invalid_private_key_length_error(self):
+        """Test length error reports the expected key length."""
         key = "0x4c0883a69102937d6231471b5dbb6204"
         is_valid, error, key_bytes = validate_private_key(key)
         assert is_valid is False
         assert "64" in error  # expected length
-    
-    def test_invalid_private_key_too_long(self):
-        """Test private key that's too long."""
-        key = "0x" + "a" * 128
-        is_valid, error, key_bytes = validate_private_key(key)
-        assert is_valid is False
-    
-    def test_invalid_private_key_non_hex(self):
-        """Test private key with non-hex characters."""
-        key = "0xzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzz"
-        is_valid, error, key_bytes = validate_private_key(key)
-        assert is_valid is False
-    
-    def test_private_key_empty(self):
-        """Test empty private key."""
-        is_valid, error, key_bytes = validate_private_key("")
-        assert is_valid is False
-    
-    def test_private_key_none(self):
-        """Test None private key."""
-        is_valid, error, key_bytes = validate_private_key(None)
-        assert is_valid is False
 
 
 class TestNormalizePrivateKey:
@@ -117,28 +99,8 @@ class TestKeystoreStructureValidation:
     """Tests for validating complete keystore structure."""
     
     def get_valid_keystore(self):
-        """Return a valid keystore structure for testing."""
-        return {
-            "version": 3,
-            "id": str(uuid.uuid4()),
-            "address": "742d35cc6634c0532925a3b844bc9e7595f8fe00",
-            "crypto": {
-                "ciphertext": "a" * 64,
-                "cipherparams": {
-                    "iv": "b" * 32
-                },
-                "cipher": "aes-128-ctr",
-                "kdf": "scrypt",
-                "kdfparams": {
-                    "n": 262144,
-                    "r": 8,
-                    "p": 1,
-                    "dklen": 32,
-                    "salt": "c" * 64
-                },
-                "mac": "d" * 64
-            }
-        }
+        """Return a fresh copy of the valid keystore template."""
+        return copy.deepcopy(KEYSTORE_TEMPLATE)
     
     def test_valid_keystore_structure(self):
         """Test validation of valid keystore structure."""